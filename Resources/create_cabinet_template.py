@@ -21,187 +21,152 @@ Parts included:
 """
 
 import bpy
-import bmesh
 import math
+import os
 import sys
-from mathutils import Vector
+import numpy as np
 
-def clear_scene():
-    """Remove all objects from scene"""
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete()
-    
-    # Clear orphan data
-    for block in bpy.data.meshes:
-        if block.users == 0:
-            bpy.data.meshes.remove(block)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from geom_math import prism_loops, strip_corners
+from template_builder import (clear_scene, mesh_from_loops, mesh_from_arrays,
+    make_box_mesh, make_plane_mesh, add_object, link_pending_objects,
+    export_glb)
+
+# T-molding strips along the cabinet's front edges as (start, end) points
+_T_MOLDING_STRIPS = np.array([
+    ((-0.04, -0.26, 0.02), (-0.04, -0.26, 1.90)),  # Left side vertical
+    ((-0.04, 0.26, 0.02), (-0.04, 0.26, 1.90)),    # Right side vertical
+    ((-0.04, -0.26, 0.02), (-0.04, 0.26, 0.02)),   # Bottom front horizontal
+    ((-0.08, -0.26, 1.90), (-0.08, 0.26, 1.90)),   # Top front horizontal (at marquee level)
+    ((-0.04, -0.26, 0.70), (-0.04, 0.26, 0.70)),   # Control panel front edge
+], dtype=np.float32)
+
+# T-molding strip cross-section and its half-extent vectors for strips
+# running along X, Y and Z: vertical strips get their width along X,
+# horizontal strips get their width along Z and depth across the strip
+_T_MOLDING_WIDTH = 0.012
+_T_MOLDING_DEPTH = 0.008
+_PERP_X = ((0, _T_MOLDING_DEPTH/2, 0), (0, 0, _T_MOLDING_WIDTH/2))
+_PERP_Y = ((_T_MOLDING_DEPTH/2, 0, 0), (0, 0, _T_MOLDING_WIDTH/2))
+_PERP_Z = ((_T_MOLDING_WIDTH/2, 0, 0), (0, _T_MOLDING_DEPTH/2, 0))
+_STRIP_PERPS = np.array([_PERP_X, _PERP_Y, _PERP_Z], dtype=np.float32)
+
+# Faces of one strip box from geom_math.strip_corners: the start ring is
+# vertices 0-3 and the end ring 4-7
+_STRIP_FACES = np.array([
+    (0, 1, 2, 3),  # Start cap
+    (7, 6, 5, 4),  # End cap
+    (0, 4, 5, 1), (1, 5, 6, 2), (2, 6, 7, 3), (3, 7, 4, 0),  # Sides
+], dtype=np.int32)
+
+# Bezel frame: outer corners 0-3 and cutout corners 4-7 on the front,
+# 8-15 the same on the back
+_BEZEL_FACES = np.array([
+    (0, 1, 5, 4), (1, 2, 6, 5), (2, 3, 7, 6), (3, 0, 4, 7),  # Front
+    (12, 13, 9, 8), (13, 14, 10, 9), (14, 15, 11, 10), (15, 12, 8, 11),  # Back
+    (0, 8, 9, 1), (1, 9, 10, 2), (2, 10, 11, 3), (3, 11, 8, 0),  # Outer edges
+    (4, 5, 13, 12), (5, 6, 14, 13), (6, 7, 15, 14), (7, 4, 12, 15),  # Cutout edges
+], dtype=np.int32)
+
+# Control panel wedge: top corners 0-3 (front left, front right, back right,
+# back left) and the matching bottom corners 4-7
+_CP_SHELL_FACES = np.array([
+    (0, 1, 2, 3),  # Top
+    (7, 6, 5, 4),  # Bottom
+    (0, 4, 5, 1),  # Front
+    (2, 6, 7, 3),  # Back
+    (0, 3, 7, 4),  # Left
+    (1, 5, 6, 2),  # Right
+], dtype=np.int32)
+
+# Classic arcade cabinet side profile as (x, z) points (in meters, scaled up)
+# Starting from bottom-front, going clockwise
+_PROFILE_2D = np.array([
+    (0.0, 0.0),      # Bottom front
+    (0.0, 0.15),     # Front kick bottom
+    (-0.05, 0.20),   # Kick angle
+    (-0.05, 0.70),   # Control panel bottom
+    (-0.15, 0.85),   # Control panel angle
+    (-0.15, 1.10),   # Below screen
+    (-0.10, 1.20),   # Screen angle start
+    (-0.05, 1.50),   # Screen area
+    (-0.08, 1.65),   # Above screen
+    (-0.10, 1.75),   # Marquee bottom
+    (-0.10, 1.90),   # Marquee top
+    (-0.05, 1.95),   # Top front
+    (-0.35, 1.95),   # Top back
+    (-0.40, 1.85),   # Back top angle
+    (-0.40, 0.0),    # Back bottom
+], dtype=np.float32)
 
-def create_box(name, location, dimensions, parent=None):
+# Side panel faces over the front and back copies of the profile, which only
+# depend on the number of profile points
+_PROFILE_LOOPS, _PROFILE_LOOP_TOTALS = prism_loops(len(_PROFILE_2D))
+
+# Box-shaped panels as (name, location, dimensions), with dimensions in
+# X=depth, Y=width, Z=height order
+_CABINET_PANELS = [
+    ("back", (-0.39, 0, 0.925), (0.02, 0.50, 1.85)),
+    ("top", (-0.22, 0, 1.94), (0.30, 0.50, 0.02)),
+    ("bottom", (-0.20, 0, 0.01), (0.40, 0.50, 0.02)),
+    ("front-kick", (-0.04, 0, 0.09), (0.02, 0.50, 0.18)),
+    ("marquee-box", (-0.12, 0, 1.82), (0.10, 0.50, 0.12)),  # Marquee housing
+    ("coin-door", (-0.04, 0, 0.35), (0.02, 0.20, 0.15)),
+    ("speaker", (-0.04, 0, 0.55), (0.02, 0.50, 0.08)),
+]
+
+# Screen mocks for orientation detection, as (name, dimensions): both are
+# a 0.01 cube scaled to the screen's proportions
+_SCREEN_MOCKS = [
+    ("screen-mock-vertical", (0.0001, 0.0026, 0.0032)),
+    ("screen-mock-horizontal", (0.0001, 0.0032, 0.0026)),
+]
+
+def create_box(name, location, dimensions):
     """Create a box mesh with given dimensions"""
-    bpy.ops.mesh.primitive_cube_add(size=1, location=location)
-    obj = bpy.context.active_object
-    obj.name = name
-    obj.scale = (dimensions[0], dimensions[1], dimensions[2])
-    bpy.ops.object.transform_apply(scale=True)
-    if parent:
-        obj.parent = parent
-    return obj
+    return add_object(name, make_box_mesh(name, *dimensions), location)
+
+def create_boxes(parts):
+    """Create box parts from (name, location, dimensions) tuples"""
+    return [create_box(name, location, dimensions)
+            for name, location, dimensions in parts]
+
+def create_plane(name, location, size, rotation=(0, 0, 0)):
+    """Create a plane of the given XY size"""
+    return add_object(name, make_plane_mesh(name, *size), location, rotation)
 
 def create_side_panel(name, is_right=False):
     """Create arcade cabinet side panel with classic profile"""
-    verts = []
-    
-    # Classic arcade cabinet side profile (in meters, scaled up)
-    # Starting from bottom-front, going clockwise
-    profile_2d = [
-        (0.0, 0.0),      # Bottom front
-        (0.0, 0.15),     # Front kick bottom
-        (-0.05, 0.20),   # Kick angle
-        (-0.05, 0.70),   # Control panel bottom
-        (-0.15, 0.85),   # Control panel angle
-        (-0.15, 1.10),   # Below screen
-        (-0.10, 1.20),   # Screen angle start
-        (-0.05, 1.50),   # Screen area
-        (-0.08, 1.65),   # Above screen
-        (-0.10, 1.75),   # Marquee bottom
-        (-0.10, 1.90),   # Marquee top
-        (-0.05, 1.95),   # Top front
-        (-0.35, 1.95),   # Top back
-        (-0.40, 1.85),   # Back top angle
-        (-0.40, 0.0),    # Back bottom
-    ]
-    
-    # Mirror for right side
-    if is_right:
-        profile_2d = [(x, y) for x, y in profile_2d]
-    
     thickness = 0.02  # Panel thickness
     
-    # Create mesh
-    mesh = bpy.data.meshes.new(name)
-    bm = bmesh.new()
-    
-    # Create front face vertices
-    front_verts = []
-    for x, z in profile_2d:
-        v = bm.verts.new((x, thickness/2 if is_right else -thickness/2, z))
-        front_verts.append(v)
-    
-    # Create back face vertices
-    back_verts = []
-    for x, z in profile_2d:
-        v = bm.verts.new((x, -thickness/2 if is_right else thickness/2, z))
-        back_verts.append(v)
-    
-    bm.verts.ensure_lookup_table()
-    
-    # Create front and back faces
-    bm.faces.new(front_verts)
-    bm.faces.new(list(reversed(back_verts)))
-    
-    # Create side faces connecting front and back
-    n = len(profile_2d)
-    for i in range(n):
-        j = (i + 1) % n
-        bm.faces.new([front_verts[i], front_verts[j], back_verts[j], back_verts[i]])
-    
-    bm.to_mesh(mesh)
-    bm.free()
+    # Front and back copies of the profile, offset along Y; only the side
+    # of the offset differs between the left and right panels
+    n = len(_PROFILE_2D)
+    y_front = thickness/2 if is_right else -thickness/2
+    verts = np.empty((2 * n, 3), dtype=np.float32)
+    verts[:n, 0] = _PROFILE_2D[:, 0]
+    verts[:n, 1] = y_front
+    verts[:n, 2] = _PROFILE_2D[:, 1]
+    verts[n:] = verts[:n]
+    verts[n:, 1] = -y_front
     
-    obj = bpy.data.objects.new(name, mesh)
-    bpy.context.collection.objects.link(obj)
+    mesh = mesh_from_loops(name, verts, _PROFILE_LOOPS, _PROFILE_LOOP_TOTALS)
     
     # Position
     y_offset = 0.25 if is_right else -0.25
-    obj.location = (0, y_offset, 0)
-    
-    return obj
-
-def create_flat_panel(name, width, height, thickness, location, rotation=(0,0,0)):
-    """Create a flat rectangular panel"""
-    bpy.ops.mesh.primitive_cube_add(size=1, location=location)
-    obj = bpy.context.active_object
-    obj.name = name
-    obj.scale = (thickness, width, height)
-    obj.rotation_euler = rotation
-    bpy.ops.object.transform_apply(scale=True, rotation=True)
-    return obj
+    return add_object(name, mesh, (0, y_offset, 0))
 
 def create_t_molding():
     """Create T-molding edge trim around cabinet using simple box strips"""
-    # T-molding dimensions
-    width = 0.012  # Width of T-molding strip
-    depth = 0.008  # Depth/thickness
-    
-    # Create mesh using bmesh for precise control
-    mesh = bpy.data.meshes.new("t-molding")
-    bm = bmesh.new()
-    
-    def add_strip(p1, p2, w, d):
-        """Add a rectangular strip between two points"""
-        start = Vector(p1)
-        end = Vector(p2)
-        direction = end - start
-        length = direction.length
-        if length < 0.001:
-            return
-        
-        direction.normalize()
-        
-        # Calculate perpendicular vectors
-        # For vertical strips (along Z), perp should be in X-Y plane
-        if abs(direction.z) > 0.9:
-            perp1 = Vector((1, 0, 0)) * (w / 2)
-            perp2 = Vector((0, 1, 0)) * (d / 2)
-        # For horizontal strips along Y
-        elif abs(direction.y) > 0.9:
-            perp1 = Vector((1, 0, 0)) * (d / 2)
-            perp2 = Vector((0, 0, 1)) * (w / 2)
-        # For horizontal strips along X
-        else:
-            perp1 = Vector((0, 1, 0)) * (d / 2)
-            perp2 = Vector((0, 0, 1)) * (w / 2)
-        
-        # Create 8 vertices for a box
-        v = []
-        for point in [start, end]:
-            v.append(bm.verts.new(point - perp1 - perp2))
-            v.append(bm.verts.new(point + perp1 - perp2))
-            v.append(bm.verts.new(point + perp1 + perp2))
-            v.append(bm.verts.new(point - perp1 + perp2))
-        
-        bm.verts.ensure_lookup_table()
-        
-        # Create faces
-        # Start cap
-        bm.faces.new([v[0], v[1], v[2], v[3]])
-        # End cap
-        bm.faces.new([v[7], v[6], v[5], v[4]])
-        # Sides
-        bm.faces.new([v[0], v[4], v[5], v[1]])
-        bm.faces.new([v[1], v[5], v[6], v[2]])
-        bm.faces.new([v[2], v[6], v[7], v[3]])
-        bm.faces.new([v[3], v[7], v[4], v[0]])
-    
-    # T-molding paths - front edges of cabinet
-    # Left side vertical (bottom to top)
-    add_strip((-0.04, -0.26, 0.02), (-0.04, -0.26, 1.90), width, depth)
-    # Right side vertical
-    add_strip((-0.04, 0.26, 0.02), (-0.04, 0.26, 1.90), width, depth)
-    # Bottom front horizontal
-    add_strip((-0.04, -0.26, 0.02), (-0.04, 0.26, 0.02), width, depth)
-    # Top front horizontal (at marquee level)
-    add_strip((-0.08, -0.26, 1.90), (-0.08, 0.26, 1.90), width, depth)
-    # Control panel front edge
-    add_strip((-0.04, -0.26, 0.70), (-0.04, 0.26, 0.70), width, depth)
-    
-    bm.to_mesh(mesh)
-    bm.free()
-    
-    obj = bpy.data.objects.new("t-molding", mesh)
-    bpy.context.collection.objects.link(obj)
-    
-    return obj
+    starts = _T_MOLDING_STRIPS[:, 0]
+    ends = _T_MOLDING_STRIPS[:, 1]
+    lengths = np.linalg.norm(ends - starts, axis=1)
+    keep = lengths >= 0.001
+    verts = strip_corners(starts[keep], ends[keep], _STRIP_PERPS)
+    faces = _STRIP_FACES + 8 * np.arange(len(verts), dtype=np.int32)[:, np.newaxis, np.newaxis]
+    
+    mesh = mesh_from_arrays("t-molding", verts.reshape(-1, 3), faces.reshape(-1, 4))
+    return add_object("t-molding", mesh)
 
 def create_bezel_with_cutout():
     """Create monitor bezel with screen cutout"""
@@ -214,84 +179,30 @@ def create_bezel_with_cutout():
     cutout_width = 0.35
     cutout_height = 0.28
     
-    mesh = bpy.data.meshes.new("bezel")
-    bm = bmesh.new()
-    
-    # Create outer rectangle vertices (front)
     hw, hh = outer_width/2, outer_height/2
     chw, chh = cutout_width/2, cutout_height/2
-    
-    # Outer corners (front)
-    v1 = bm.verts.new((-hw, -thickness/2, -hh))
-    v2 = bm.verts.new((hw, -thickness/2, -hh))
-    v3 = bm.verts.new((hw, -thickness/2, hh))
-    v4 = bm.verts.new((-hw, -thickness/2, hh))
-    
-    # Cutout corners (front)
-    v5 = bm.verts.new((-chw, -thickness/2, -chh))
-    v6 = bm.verts.new((chw, -thickness/2, -chh))
-    v7 = bm.verts.new((chw, -thickness/2, chh))
-    v8 = bm.verts.new((-chw, -thickness/2, chh))
-    
-    # Outer corners (back)
-    v1b = bm.verts.new((-hw, thickness/2, -hh))
-    v2b = bm.verts.new((hw, thickness/2, -hh))
-    v3b = bm.verts.new((hw, thickness/2, hh))
-    v4b = bm.verts.new((-hw, thickness/2, hh))
-    
-    # Cutout corners (back)
-    v5b = bm.verts.new((-chw, thickness/2, -chh))
-    v6b = bm.verts.new((chw, thickness/2, -chh))
-    v7b = bm.verts.new((chw, thickness/2, chh))
-    v8b = bm.verts.new((-chw, thickness/2, chh))
-    
-    bm.verts.ensure_lookup_table()
-    
-    # Front face (with hole) - create as 4 quads around the hole
-    bm.faces.new([v1, v2, v6, v5])  # Bottom
-    bm.faces.new([v2, v3, v7, v6])  # Right
-    bm.faces.new([v3, v4, v8, v7])  # Top
-    bm.faces.new([v4, v1, v5, v8])  # Left
-    
-    # Back face (with hole)
-    bm.faces.new([v5b, v6b, v2b, v1b])
-    bm.faces.new([v6b, v7b, v3b, v2b])
-    bm.faces.new([v7b, v8b, v4b, v3b])
-    bm.faces.new([v8b, v5b, v1b, v4b])
-    
-    # Outer edges
-    bm.faces.new([v1, v1b, v2b, v2])
-    bm.faces.new([v2, v2b, v3b, v3])
-    bm.faces.new([v3, v3b, v4b, v4])
-    bm.faces.new([v4, v4b, v1b, v1])
-    
-    # Inner edges (cutout)
-    bm.faces.new([v5, v6, v6b, v5b])
-    bm.faces.new([v6, v7, v7b, v6b])
-    bm.faces.new([v7, v8, v8b, v7b])
-    bm.faces.new([v8, v5, v5b, v8b])
-    
-    bm.to_mesh(mesh)
-    bm.free()
-    
-    obj = bpy.data.objects.new("bezel", mesh)
-    bpy.context.collection.objects.link(obj)
-    
-    # Position at screen location
-    obj.location = (-0.07, 0, 1.35)
-    obj.rotation_euler = (0, -0.25, 0)  # Tilt back slightly
-    
-    return obj
+    t = thickness/2
+    
+    verts = np.array([
+        # Outer corners (front)
+        (-hw, -t, -hh), (hw, -t, -hh), (hw, -t, hh), (-hw, -t, hh),
+        # Cutout corners (front)
+        (-chw, -t, -chh), (chw, -t, -chh), (chw, -t, chh), (-chw, -t, chh),
+        # Outer corners (back)
+        (-hw, t, -hh), (hw, t, -hh), (hw, t, hh), (-hw, t, hh),
+        # Cutout corners (back)
+        (-chw, t, -chh), (chw, t, -chh), (chw, t, chh), (-chw, t, chh),
+    ], dtype=np.float32)
+    
+    mesh = mesh_from_arrays("bezel", verts, _BEZEL_FACES)
+    
+    # Position at screen location, tilted back slightly
+    return add_object("bezel", mesh, (-0.07, 0, 1.35), rotation=(0, -0.25, 0))
 
 def create_screen():
     """Create screen surface for video playback"""
-    bpy.ops.mesh.primitive_plane_add(size=1, location=(-0.06, 0, 1.35))
-    obj = bpy.context.active_object
-    obj.name = "screen"
-    obj.scale = (0.32, 0.26, 1)
-    obj.rotation_euler = (math.pi/2, -0.25, 0)  # Face forward, tilted
-    bpy.ops.object.transform_apply(scale=True, rotation=True)
-    return obj
+    # Face forward, tilted
+    return create_plane("screen", (-0.06, 0, 1.35), (0.32, 0.26), (math.pi/2, -0.25, 0))
 
 def create_cabinet():
     """Create complete arcade cabinet with all parts"""
@@ -300,78 +211,32 @@ def create_cabinet():
     print("Creating arcade cabinet template...")
     
     # Create parent empty for organization
-    bpy.ops.object.empty_add(type='PLAIN_AXES', location=(0, 0, 0))
-    root = bpy.context.active_object
-    root.name = "cabinet-root"
+    root = add_object("cabinet-root", None)
     
     # Side panels
     print("  Creating side panels...")
-    left = create_side_panel("left", is_right=False)
-    left.parent = root
-    
-    right = create_side_panel("right", is_right=True)
-    right.parent = root
-    
-    # Back panel
-    print("  Creating back panel...")
-    back = create_flat_panel("back", 0.50, 1.85, 0.02, (-0.39, 0, 0.925))
-    back.parent = root
-    
-    # Top panel - create as horizontal panel at top of cabinet
-    print("  Creating top panel...")
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(-0.22, 0, 1.94))
-    top = bpy.context.active_object
-    top.name = "top"
-    # For a horizontal panel: X=depth, Y=width, Z=thickness
-    top.scale = (0.30, 0.50, 0.02)
-    bpy.ops.object.transform_apply(scale=True)
-    top.parent = root
+    create_side_panel("left", is_right=False)
     
-    # Bottom panel - create as horizontal panel at bottom of cabinet
-    print("  Creating bottom panel...")
-    bpy.ops.mesh.primitive_cube_add(size=1, location=(-0.20, 0, 0.01))
-    bottom = bpy.context.active_object
-    bottom.name = "bottom"
-    # For a horizontal panel: X=depth, Y=width, Z=thickness
-    bottom.scale = (0.40, 0.50, 0.02)
-    bpy.ops.object.transform_apply(scale=True)
-    bottom.parent = root
+    create_side_panel("right", is_right=True)
     
-    # Front kick plate
-    print("  Creating front kick plate...")
-    front_kick = create_flat_panel("front-kick", 0.50, 0.18, 0.02, (-0.04, 0, 0.09))
-    front_kick.parent = root
-    
-    # Marquee box (housing)
-    print("  Creating marquee box...")
-    marquee_box = create_flat_panel("marquee-box", 0.50, 0.12, 0.10, (-0.12, 0, 1.82))
-    marquee_box.parent = root
+    # Back, top, bottom, front kick, marquee box, coin door and speaker
+    print("  Creating box panels...")
+    create_boxes(_CABINET_PANELS)
     
     # Marquee (display panel)
     print("  Creating marquee...")
-    bpy.ops.mesh.primitive_plane_add(size=1, location=(-0.06, 0, 1.82))
-    marquee = bpy.context.active_object
-    marquee.name = "marquee"
-    marquee.scale = (0.48, 0.10, 1)
-    marquee.rotation_euler = (math.pi/2, -0.1, 0)
-    bpy.ops.object.transform_apply(scale=True, rotation=True)
-    marquee.parent = root
+    create_plane("marquee", (-0.06, 0, 1.82), (0.48, 0.10), (math.pi/2, -0.1, 0))
     
     # Bezel (with screen cutout)
     print("  Creating bezel...")
-    bezel = create_bezel_with_cutout()
-    bezel.parent = root
+    create_bezel_with_cutout()
     
     # Screen
     print("  Creating screen...")
-    screen = create_screen()
-    screen.parent = root
+    create_screen()
     
     # Control panel shell - angled wedge for control surface
     print("  Creating control panel shell...")
-    mesh = bpy.data.meshes.new("cp-shell")
-    bm_cp = bmesh.new()
-    
     # Create angled control panel as a wedge
     # Front edge is higher, back edge is lower (tilted toward player)
     cp_width = 0.50  # Width (Y axis)
@@ -381,95 +246,42 @@ def create_cabinet():
     cp_thickness = 0.03
     
     hw = cp_width / 2
+    cp_back_x = -0.04 - cp_depth
     
-    # Top surface vertices (angled)
-    v1 = bm_cp.verts.new((-0.04, -hw, cp_front_z))  # Front left
-    v2 = bm_cp.verts.new((-0.04, hw, cp_front_z))   # Front right
-    v3 = bm_cp.verts.new((-0.04 - cp_depth, hw, cp_back_z))   # Back right
-    v4 = bm_cp.verts.new((-0.04 - cp_depth, -hw, cp_back_z))  # Back left
-    
-    # Bottom surface vertices
-    v5 = bm_cp.verts.new((-0.04, -hw, cp_front_z - cp_thickness))
-    v6 = bm_cp.verts.new((-0.04, hw, cp_front_z - cp_thickness))
-    v7 = bm_cp.verts.new((-0.04 - cp_depth, hw, cp_back_z - cp_thickness))
-    v8 = bm_cp.verts.new((-0.04 - cp_depth, -hw, cp_back_z - cp_thickness))
+    verts = np.array([
+        # Top surface vertices (angled)
+        (-0.04, -hw, cp_front_z),     # Front left
+        (-0.04, hw, cp_front_z),      # Front right
+        (cp_back_x, hw, cp_back_z),   # Back right
+        (cp_back_x, -hw, cp_back_z),  # Back left
+        # Bottom surface vertices
+        (-0.04, -hw, cp_front_z - cp_thickness),
+        (-0.04, hw, cp_front_z - cp_thickness),
+        (cp_back_x, hw, cp_back_z - cp_thickness),
+        (cp_back_x, -hw, cp_back_z - cp_thickness),
+    ], dtype=np.float32)
     
-    bm_cp.verts.ensure_lookup_table()
+    mesh = mesh_from_arrays("cp-shell", verts, _CP_SHELL_FACES)
     
-    # Faces
-    bm_cp.faces.new([v1, v2, v3, v4])  # Top
-    bm_cp.faces.new([v8, v7, v6, v5])  # Bottom
-    bm_cp.faces.new([v1, v5, v6, v2])  # Front
-    bm_cp.faces.new([v3, v7, v8, v4])  # Back
-    bm_cp.faces.new([v1, v4, v8, v5])  # Left
-    bm_cp.faces.new([v2, v6, v7, v3])  # Right
-    
-    bm_cp.to_mesh(mesh)
-    bm_cp.free()
-    
-    cp_shell = bpy.data.objects.new("cp-shell", mesh)
-    bpy.context.collection.objects.link(cp_shell)
-    cp_shell.parent = root
+    add_object("cp-shell", mesh)
     
     # Control panel / joystick overlay
     print("  Creating control panel overlay...")
-    bpy.ops.mesh.primitive_plane_add(size=1, location=(-0.08, 0, 0.85))
-    joystick = bpy.context.active_object
-    joystick.name = "joystick"
-    joystick.scale = (0.48, 0.18, 1)
-    joystick.rotation_euler = (math.pi/2 + 0.3, 0, 0)
-    bpy.ops.object.transform_apply(scale=True, rotation=True)
-    joystick.parent = root
-    
-    # Coin door
-    print("  Creating coin door...")
-    coin_door = create_flat_panel("coin-door", 0.20, 0.15, 0.02, (-0.04, 0, 0.35))
-    coin_door.parent = root
-    
-    # Speaker panel
-    print("  Creating speaker panel...")
-    speaker = create_flat_panel("speaker", 0.50, 0.08, 0.02, (-0.04, 0, 0.55))
-    speaker.parent = root
+    create_plane("joystick", (-0.08, 0, 0.85), (0.48, 0.18), (math.pi/2 + 0.3, 0, 0))
     
     # T-Molding
     print("  Creating T-molding...")
-    t_molding = create_t_molding()
-    if t_molding:
-        t_molding.parent = root
+    create_t_molding()
     
     # Create screen mock objects for orientation detection
     print("  Creating screen mocks...")
+    create_boxes([(name, (-0.06, 0, 1.35), dimensions) for name, dimensions in _SCREEN_MOCKS])
     
-    # Vertical screen mock
-    bpy.ops.mesh.primitive_cube_add(size=0.01, location=(-0.06, 0, 1.35))
-    screen_mock_v = bpy.context.active_object
-    screen_mock_v.name = "screen-mock-vertical"
-    screen_mock_v.scale = (0.01, 0.26, 0.32)
-    bpy.ops.object.transform_apply(scale=True)
-    screen_mock_v.parent = root
-    
-    # Horizontal screen mock  
-    bpy.ops.mesh.primitive_cube_add(size=0.01, location=(-0.06, 0, 1.35))
-    screen_mock_h = bpy.context.active_object
-    screen_mock_h.name = "screen-mock-horizontal"
-    screen_mock_h.scale = (0.01, 0.32, 0.26)
-    bpy.ops.object.transform_apply(scale=True)
-    screen_mock_h.parent = root
+    link_pending_objects(root)
     
     print("Cabinet creation complete!")
     return root
 
-def export_glb(filepath):
-    """Export scene to GLB format"""
-    print(f"Exporting to: {filepath}")
-    bpy.ops.export_scene.gltf(
-        filepath=filepath,
-        export_format='GLB',
-        use_selection=False,
-        export_apply=True,
-    )
-    print("Export complete!")
-
 def main():
     # Get output path from command line
     argv = sys.argv
@@ -16,283 +16,211 @@ Driving cabinets feature:
 import bpy
 import bmesh
 import math
+import os
 import sys
-from mathutils import Vector
+import numpy as np
+from mathutils import Euler, Matrix, Vector
 
-def clear_scene():
-    """Remove all objects from scene"""
-    bpy.ops.object.select_all(action='SELECT')
-    bpy.ops.object.delete()
-    for block in bpy.data.meshes:
-        if block.users == 0:
-            bpy.data.meshes.remove(block)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from geom_math import prism_loops, tube_matrices
+from template_builder import (clear_scene, mesh_from_loops, mesh_from_arrays,
+    make_box_mesh, make_plane_mesh, add_object, add_bmesh_object,
+    link_pending_objects, export_glb)
 
-def create_box(name, dimensions, location=(0,0,0)):
-    """Create a box mesh"""
-    bpy.ops.mesh.primitive_cube_add(size=1, location=location)
-    obj = bpy.context.active_object
-    obj.name = name
-    obj.scale = dimensions
-    bpy.ops.object.transform_apply(scale=True)
-    return obj
+# Corners of a rectangle as signs of its half-width and half-height
+_RECT_CORNERS = np.array([(-1, -1), (1, -1), (1, 1), (-1, 1)], dtype=np.float32)
+
+# Bezel frame: outer corners 0-3 and cutout corners 4-7 on the front,
+# 8-15 the same on the back
+_BEZEL_FACES = np.array([
+    (0, 1, 5, 4), (1, 2, 6, 5), (2, 3, 7, 6), (3, 0, 4, 7),  # Front
+    (12, 13, 9, 8), (13, 14, 10, 9), (14, 15, 11, 10), (15, 12, 8, 11),  # Back
+    (0, 8, 9, 1), (1, 9, 10, 2), (2, 10, 11, 3), (3, 11, 8, 0),  # Outer edges
+    (4, 5, 13, 12), (5, 6, 14, 13), (6, 7, 15, 14), (7, 4, 12, 15),  # Cutout edges
+], dtype=np.int32)
+
+# Bucket seat: cushion box corners 0-7 (bottom ring, then top ring) and
+# backrest corners 8-15 (base ring on the cushion, then top ring)
+_SEAT_FACES = np.array([
+    (0, 1, 2, 3), (7, 6, 5, 4), (0, 4, 5, 1),  # Cushion bottom, top, front
+    (2, 6, 7, 3), (0, 3, 7, 4), (1, 5, 6, 2),  # Cushion back, left, right
+    (8, 9, 13, 12), (10, 11, 15, 14),          # Backrest front, back
+    (9, 10, 14, 13), (11, 8, 12, 15),          # Backrest sides
+    (12, 13, 14, 15),                          # Backrest top
+], dtype=np.int32)
+
+# Driving cabinet side profile as (x, z) points, wraparound shaped
+_PROFILE_2D = np.array([
+    (0.0, 0.0),        # Bottom front (where player sits)
+    (0.0, 0.40),       # Front foot area
+    (-0.20, 0.50),     # Dashboard angle start
+    (-0.30, 0.80),     # Dashboard
+    (-0.35, 1.10),     # Below screen
+    (-0.30, 1.50),     # Screen area (angled back)
+    (-0.25, 1.70),     # Above screen
+    (-0.20, 1.85),     # Marquee area
+    (-0.15, 1.95),     # Top front
+    (-0.80, 1.95),     # Top back (long for sit-down)
+    (-0.85, 1.80),     # Back upper
+    (-0.85, 0.35),     # Back seat area
+    (-0.80, 0.0),      # Back bottom
+], dtype=np.float32)
+
+# Side panel faces over the front and back copies of the profile, which only
+# depend on the number of profile points
+_PROFILE_LOOPS, _PROFILE_LOOP_TOTALS = prism_loops(len(_PROFILE_2D))
+
+# Box-shaped panels as (name, dimensions, location, rotation)
+_CABINET_PANELS = [
+    ("back", (0.02, 0.98, 1.60), (-0.84, 0, 0.90), (0, 0, 0)),
+    ("top", (0.70, 0.98, 0.02), (-0.47, 0, 1.94), (0, 0, 0)),
+    ("bottom", (0.85, 0.98, 0.02), (-0.42, 0, 0.01), (0, 0, 0)),
+    ("dashboard", (0.25, 0.70, 0.02), (-0.27, 0, 0.72), (0.8, 0, 0)),  # Angled toward player
+    ("marquee-box", (0.12, 0.98, 0.15), (-0.19, 0, 1.87), (0, 0, 0)),
+    ("coin-door", (0.02, 0.15, 0.10), (-0.05, 0.30, 0.35), (0, 0, 0)),
+    ("speaker", (0.02, 0.30, 0.08), (-0.22, 0, 1.65), (0, 0, 0)),  # In dashboard area
+    ("front-kick", (0.15, 0.60, 0.02), (-0.07, 0, 0.25), (1.2, 0, 0)),  # Foot rest area
+]
+
+# Screen mocks for orientation detection, as (name, dimensions): both are
+# a 0.01 cube scaled to the screen's proportions
+_SCREEN_MOCKS = [
+    ("screen-mock-horizontal", (0.0001, 0.0072, 0.0042)),
+    ("screen-mock-vertical", (0.0001, 0.0042, 0.0072)),
+]
+
+# Ring resolution of T-molding tubes (primitive_cylinder_add's default)
+_TUBE_SEGMENTS = 32
+
+def create_box(name, dimensions, location=(0,0,0), rotation=(0, 0, 0)):
+    """Create a box mesh with given dimensions
+
+    The rotation turns the box about the world origin, location included,
+    as applying all transforms and then the rotation used to.
+    """
+    if any(rotation):
+        location = Euler(rotation).to_matrix() @ Vector(location)
+    return add_object(name, make_box_mesh(name, *dimensions), location, rotation)
+
+def create_boxes(parts):
+    """Create box parts from (name, dimensions, location, rotation) tuples"""
+    return [create_box(name, dimensions, location, rotation)
+            for name, dimensions, location, rotation in parts]
+
+def create_plane(name, size, location, rotation=(0, 0, 0)):
+    """Create a plane of the given XY size"""
+    return add_object(name, make_plane_mesh(name, *size), location, rotation)
 
 def create_side_panel_driving(name, is_right=False):
     """Create driving cabinet side panel - wide and enclosing"""
-    # Driving cabinets have a distinctive wraparound shape
-    profile_2d = [
-        (0.0, 0.0),        # Bottom front (where player sits)
-        (0.0, 0.40),       # Front foot area
-        (-0.20, 0.50),     # Dashboard angle start
-        (-0.30, 0.80),     # Dashboard
-        (-0.35, 1.10),     # Below screen
-        (-0.30, 1.50),     # Screen area (angled back)
-        (-0.25, 1.70),     # Above screen
-        (-0.20, 1.85),     # Marquee area
-        (-0.15, 1.95),     # Top front
-        (-0.80, 1.95),     # Top back (long for sit-down)
-        (-0.85, 1.80),     # Back upper
-        (-0.85, 0.35),     # Back seat area
-        (-0.80, 0.0),      # Back bottom
-    ]
-    
     thickness = 0.02
     
-    mesh = bpy.data.meshes.new(name)
-    bm = bmesh.new()
-    
-    # Wider spacing for driving cabinet
+    # Front and back copies of the profile, wider spaced for driving cabinet
+    n = len(_PROFILE_2D)
     y_offset = 0.50 if is_right else -0.50
     y_back = y_offset - thickness if is_right else y_offset + thickness
-    
-    front_verts = [bm.verts.new((x, y_offset, z)) for x, z in profile_2d]
-    back_verts = [bm.verts.new((x, y_back, z)) for x, z in profile_2d]
-    
-    bm.verts.ensure_lookup_table()
-    
-    # Create faces
-    bm.faces.new(front_verts)
-    bm.faces.new(list(reversed(back_verts)))
-    
-    n = len(profile_2d)
-    for i in range(n):
-        j = (i + 1) % n
-        bm.faces.new([front_verts[i], front_verts[j], back_verts[j], back_verts[i]])
-    
-    bm.to_mesh(mesh)
-    bm.free()
-    
-    obj = bpy.data.objects.new(name, mesh)
-    bpy.context.collection.objects.link(obj)
-    
-    return obj
+    verts = np.empty((2 * n, 3), dtype=np.float32)
+    verts[:n, 0] = _PROFILE_2D[:, 0]
+    verts[:n, 1] = y_offset
+    verts[:n, 2] = _PROFILE_2D[:, 1]
+    verts[n:] = verts[:n]
+    verts[n:, 1] = y_back
+    
+    mesh = mesh_from_loops(name, verts, _PROFILE_LOOPS, _PROFILE_LOOP_TOTALS)
+    return add_object(name, mesh)
 
 def create_steering_wheel(name, location):
     """Create a steering wheel"""
-    # Wheel rim (torus)
-    bpy.ops.mesh.primitive_torus_add(
-        major_radius=0.15,
-        minor_radius=0.015,
-        location=location
-    )
-    wheel = bpy.context.active_object
-    wheel.rotation_euler = (math.pi/2 - 0.5, 0, 0)  # Angled toward player
+    bm = bmesh.new()
+    bm.loops.layers.uv.new("UVMap")
+    tilt = Matrix.Rotation(math.pi/2 - 0.5, 4, 'X')  # Angled toward player
+    
+    # Wheel rim: a minor circle in the XZ plane swept around Z into a torus
+    ring = bmesh.ops.create_circle(
+        bm, segments=12, radius=0.015,
+        matrix=Matrix.Translation((0.15, 0, 0)) @ Matrix.Rotation(math.pi/2, 4, 'X'),
+    )["verts"]
+    ring_edges = list({e for v in ring for e in v.link_edges})
+    bmesh.ops.spin(bm, geom=ring + ring_edges, cent=(0, 0, 0), axis=(0, 0, 1),
+                   angle=2 * math.pi, steps=48, use_merge=True)
+    bmesh.ops.transform(bm, matrix=tilt, verts=bm.verts[:])
     
     # Center hub
-    bpy.ops.mesh.primitive_cylinder_add(
-        radius=0.04,
-        depth=0.03,
-        location=location
-    )
-    hub = bpy.context.active_object
-    hub.rotation_euler = (math.pi/2 - 0.5, 0, 0)
-    
-    # Spokes (3 of them)
-    spokes = []
+    bmesh.ops.create_cone(bm, cap_ends=True, segments=32, radius1=0.04, radius2=0.04,
+                          depth=0.03, matrix=tilt, calc_uvs=True)
+    
+    # Spokes (3 of them), turned about the world Z axis
+    spoke_scale = Matrix.Diagonal((0.12, 0.015, 0.01, 1))
     for i in range(3):
         angle = i * (2 * math.pi / 3)
-        bpy.ops.mesh.primitive_cube_add(size=1, location=location)
-        spoke = bpy.context.active_object
-        spoke.scale = (0.12, 0.015, 0.01)
-        spoke.rotation_euler = (math.pi/2 - 0.5, 0, angle)
-        bpy.ops.object.transform_apply(scale=True, rotation=True)
-        spokes.append(spoke)
-    
-    # Join all parts
-    bpy.ops.object.select_all(action='DESELECT')
-    wheel.select_set(True)
-    hub.select_set(True)
-    for spoke in spokes:
-        spoke.select_set(True)
-    bpy.context.view_layer.objects.active = wheel
-    bpy.ops.object.join()
-    
-    wheel.name = name
-    bpy.ops.object.transform_apply(rotation=True)
-    return wheel
+        bmesh.ops.create_cube(bm, size=1, calc_uvs=True,
+                              matrix=Matrix.Rotation(angle, 4, 'Z') @ tilt @ spoke_scale)
+    
+    return add_bmesh_object(name, bm, location)
 
-def create_pedals(parent):
+def create_pedals():
     """Create gas and brake pedals"""
     # Gas pedal (right)
-    gas = create_box("gas-pedal", (0.08, 0.12, 0.02), (-0.05, 0.15, 0.05))
-    gas.rotation_euler = (0.6, 0, 0)
-    bpy.ops.object.transform_apply(rotation=True)
-    gas.parent = parent
+    gas = create_box("gas-pedal", (0.08, 0.12, 0.02), (-0.05, 0.15, 0.05), (0.6, 0, 0))
     
     # Brake pedal (left, larger)
-    brake = create_box("brake-pedal", (0.10, 0.15, 0.02), (-0.05, -0.10, 0.05))
-    brake.rotation_euler = (0.6, 0, 0)
-    bpy.ops.object.transform_apply(rotation=True)
-    brake.parent = parent
+    brake = create_box("brake-pedal", (0.10, 0.15, 0.02), (-0.05, -0.10, 0.05), (0.6, 0, 0))
     
     return gas, brake
 
 def create_gear_shifter(name, location):
     """Create a gear shifter"""
+    bm = bmesh.new()
+    bm.loops.layers.uv.new("UVMap")
+    
     # Base
-    bpy.ops.mesh.primitive_cylinder_add(radius=0.025, depth=0.03, location=location)
-    base = bpy.context.active_object
+    bmesh.ops.create_cone(bm, cap_ends=True, segments=32, radius1=0.025, radius2=0.025,
+                          depth=0.03, calc_uvs=True)
     
     # Shaft
-    shaft_loc = (location[0], location[1], location[2] + 0.08)
-    bpy.ops.mesh.primitive_cylinder_add(radius=0.012, depth=0.13, location=shaft_loc)
-    shaft = bpy.context.active_object
+    bmesh.ops.create_cone(bm, cap_ends=True, segments=32, radius1=0.012, radius2=0.012,
+                          depth=0.13, matrix=Matrix.Translation((0, 0, 0.08)), calc_uvs=True)
     
     # Knob
-    knob_loc = (location[0], location[1], location[2] + 0.15)
-    bpy.ops.mesh.primitive_uv_sphere_add(radius=0.025, location=knob_loc)
-    knob = bpy.context.active_object
-    
-    # Join
-    bpy.ops.object.select_all(action='DESELECT')
-    base.select_set(True)
-    shaft.select_set(True)
-    knob.select_set(True)
-    bpy.context.view_layer.objects.active = base
-    bpy.ops.object.join()
-    
-    base.name = name
-    return base
+    bmesh.ops.create_uvsphere(bm, u_segments=32, v_segments=16, radius=0.025,
+                              matrix=Matrix.Translation((0, 0, 0.15)), calc_uvs=True)
+    
+    return add_bmesh_object(name, bm, location)
 
 def create_seat(name, location):
     """Create a bucket seat"""
-    mesh = bpy.data.meshes.new(name)
-    bm = bmesh.new()
-    
     # Seat base (cushion)
     seat_w, seat_d, seat_h = 0.40, 0.40, 0.08
     sw, sd, sh = seat_w/2, seat_d/2, seat_h
     
-    # Seat cushion vertices
-    v1 = bm.verts.new((-sw, -sd, 0))
-    v2 = bm.verts.new((sw, -sd, 0))
-    v3 = bm.verts.new((sw, sd, 0))
-    v4 = bm.verts.new((-sw, sd, 0))
-    v5 = bm.verts.new((-sw, -sd, sh))
-    v6 = bm.verts.new((sw, -sd, sh))
-    v7 = bm.verts.new((sw, sd, sh))
-    v8 = bm.verts.new((-sw, sd, sh))
-    
-    bm.verts.ensure_lookup_table()
-    
-    # Cushion faces
-    bm.faces.new([v1, v2, v3, v4])  # Bottom
-    bm.faces.new([v8, v7, v6, v5])  # Top
-    bm.faces.new([v1, v5, v6, v2])  # Front
-    bm.faces.new([v3, v7, v8, v4])  # Back
-    bm.faces.new([v1, v4, v8, v5])  # Left
-    bm.faces.new([v2, v6, v7, v3])  # Right
-    
     # Backrest
     back_h = 0.50
-    b1 = bm.verts.new((-sw, sd - 0.05, sh))
-    b2 = bm.verts.new((sw, sd - 0.05, sh))
-    b3 = bm.verts.new((sw, sd, sh))
-    b4 = bm.verts.new((-sw, sd, sh))
-    b5 = bm.verts.new((-sw * 0.9, sd - 0.08, sh + back_h))
-    b6 = bm.verts.new((sw * 0.9, sd - 0.08, sh + back_h))
-    b7 = bm.verts.new((sw * 0.9, sd - 0.02, sh + back_h))
-    b8 = bm.verts.new((-sw * 0.9, sd - 0.02, sh + back_h))
-    
-    bm.verts.ensure_lookup_table()
-    
-    bm.faces.new([b1, b2, b6, b5])
-    bm.faces.new([b3, b4, b8, b7])
-    bm.faces.new([b2, b3, b7, b6])
-    bm.faces.new([b4, b1, b5, b8])
-    bm.faces.new([b5, b6, b7, b8])
-    
-    bm.to_mesh(mesh)
-    bm.free()
-    
-    obj = bpy.data.objects.new(name, mesh)
-    bpy.context.collection.objects.link(obj)
-    obj.location = location
-    
-    return obj
+    top_h = sh + back_h
+    
+    verts = np.array([
+        # Seat cushion
+        (-sw, -sd, 0), (sw, -sd, 0), (sw, sd, 0), (-sw, sd, 0),
+        (-sw, -sd, sh), (sw, -sd, sh), (sw, sd, sh), (-sw, sd, sh),
+        # Backrest
+        (-sw, sd - 0.05, sh), (sw, sd - 0.05, sh), (sw, sd, sh), (-sw, sd, sh),
+        (-sw * 0.9, sd - 0.08, top_h), (sw * 0.9, sd - 0.08, top_h),
+        (sw * 0.9, sd - 0.02, top_h), (-sw * 0.9, sd - 0.02, top_h),
+    ], dtype=np.float32)
+    
+    return add_object(name, mesh_from_arrays(name, verts, _SEAT_FACES), location)
 
 def create_bezel_with_cutout(name, outer_w, outer_h, cutout_w, cutout_h, thickness=0.015):
     """Create a bezel panel with screen cutout"""
-    mesh = bpy.data.meshes.new(name)
-    bm = bmesh.new()
-    
-    hw, hh = outer_w/2, outer_h/2
-    chw, chh = cutout_w/2, cutout_h/2
     t = thickness/2
     
-    # Outer corners (front)
-    v1 = bm.verts.new((-hw, -t, -hh))
-    v2 = bm.verts.new((hw, -t, -hh))
-    v3 = bm.verts.new((hw, -t, hh))
-    v4 = bm.verts.new((-hw, -t, hh))
-    
-    # Cutout corners (front)
-    v5 = bm.verts.new((-chw, -t, -chh))
-    v6 = bm.verts.new((chw, -t, -chh))
-    v7 = bm.verts.new((chw, -t, chh))
-    v8 = bm.verts.new((-chw, -t, chh))
-    
-    # Back vertices
-    v1b = bm.verts.new((-hw, t, -hh))
-    v2b = bm.verts.new((hw, t, -hh))
-    v3b = bm.verts.new((hw, t, hh))
-    v4b = bm.verts.new((-hw, t, hh))
-    v5b = bm.verts.new((-chw, t, -chh))
-    v6b = bm.verts.new((chw, t, -chh))
-    v7b = bm.verts.new((chw, t, chh))
-    v8b = bm.verts.new((-chw, t, chh))
-    
-    bm.verts.ensure_lookup_table()
-    
-    # Front faces (with hole)
-    bm.faces.new([v1, v2, v6, v5])
-    bm.faces.new([v2, v3, v7, v6])
-    bm.faces.new([v3, v4, v8, v7])
-    bm.faces.new([v4, v1, v5, v8])
-    
-    # Back faces
-    bm.faces.new([v5b, v6b, v2b, v1b])
-    bm.faces.new([v6b, v7b, v3b, v2b])
-    bm.faces.new([v7b, v8b, v4b, v3b])
-    bm.faces.new([v8b, v5b, v1b, v4b])
-    
-    # Outer edges
-    bm.faces.new([v1, v1b, v2b, v2])
-    bm.faces.new([v2, v2b, v3b, v3])
-    bm.faces.new([v3, v3b, v4b, v4])
-    bm.faces.new([v4, v4b, v1b, v1])
-    
-    # Cutout edges
-    bm.faces.new([v5, v6, v6b, v5b])
-    bm.faces.new([v6, v7, v7b, v6b])
-    bm.faces.new([v7, v8, v8b, v7b])
-    bm.faces.new([v8, v5, v5b, v8b])
-    
-    bm.to_mesh(mesh)
-    bm.free()
-    
-    obj = bpy.data.objects.new(name, mesh)
-    bpy.context.collection.objects.link(obj)
-    return obj
+    # Outer then cutout rectangle, on the front (-t) then the back (+t)
+    half_sizes = np.array([(outer_w/2, outer_h/2), (cutout_w/2, cutout_h/2)], dtype=np.float32)
+    verts = np.empty((2, 2, 4, 3), dtype=np.float32)
+    verts[..., [0, 2]] = _RECT_CORNERS * half_sizes[:, np.newaxis]
+    verts[..., 1] = np.array((-t, t), dtype=np.float32)[:, np.newaxis, np.newaxis]
+    
+    mesh = mesh_from_arrays(name, verts.reshape(-1, 3), _BEZEL_FACES)
+    return add_object(name, mesh)
 
 def create_t_molding_driving():
     """Create T-molding for driving cabinet"""
@@ -308,51 +236,24 @@ def create_t_molding_driving():
         (-0.20, 0.50, 0.50),    # Right front lower
     ]
     
-    def create_tube_segment(p1, p2, r):
-        direction = Vector(p2) - Vector(p1)
-        length = direction.length
-        if length < 0.001:
-            return None
-        
-        bpy.ops.mesh.primitive_cylinder_add(
-            radius=r,
-            depth=length,
-            location=((p1[0]+p2[0])/2, (p1[1]+p2[1])/2, (p1[2]+p2[2])/2)
-        )
-        cyl = bpy.context.active_object
-        
-        direction.normalize()
-        up = Vector((0, 0, 1))
-        if abs(direction.dot(up)) > 0.999:
-            up = Vector((1, 0, 0))
-        
-        rot_axis = up.cross(direction)
-        if rot_axis.length > 0.001:
-            rot_axis.normalize()
-            rot_angle = math.acos(max(-1, min(1, up.dot(direction))))
-            cyl.rotation_mode = 'AXIS_ANGLE'
-            cyl.rotation_axis_angle = (rot_angle, rot_axis.x, rot_axis.y, rot_axis.z)
-        
-        return cyl
-    
-    segments = []
-    for i in range(len(path) - 1):
-        seg = create_tube_segment(path[i], path[i+1], radius)
-        if seg:
-            segments.append(seg)
-    
-    if segments:
-        bpy.ops.object.select_all(action='DESELECT')
-        for seg in segments:
-            seg.select_set(True)
-        bpy.context.view_layer.objects.active = segments[0]
-        bpy.ops.object.join()
-        
-        obj = bpy.context.active_object
-        obj.name = "t-molding"
-        return obj
-    
-    return None
+    path = np.array(path)
+    starts, ends = path[:-1], path[1:]
+    lengths = np.linalg.norm(ends - starts, axis=1)
+    keep = lengths >= 0.001
+    
+    # One capped cylinder per segment, turned onto it by its matrix
+    bm = bmesh.new()
+    bm.loops.layers.uv.new("UVMap")
+    for matrix, length in zip(tube_matrices(starts[keep], ends[keep]), lengths[keep]):
+        bmesh.ops.create_cone(bm, cap_ends=True, cap_tris=False, segments=_TUBE_SEGMENTS,
+                              radius1=radius, radius2=radius, depth=length,
+                              matrix=Matrix(matrix), calc_uvs=True)
+    
+    if not bm.faces:
+        bm.free()
+        return None
+    
+    return add_bmesh_object("t-molding", bm)
 
 def create_driving_cabinet():
     """Create complete driving arcade cabinet"""
@@ -361,149 +262,65 @@ def create_driving_cabinet():
     print("Creating driving cabinet template...")
     
     # Create root
-    bpy.ops.object.empty_add(type='PLAIN_AXES', location=(0, 0, 0))
-    root = bpy.context.active_object
-    root.name = "cabinet-root"
+    root = add_object("cabinet-root", None)
     
     # Side panels
     print("  Creating side panels...")
-    left = create_side_panel_driving("left", is_right=False)
-    left.parent = root
-    
-    right = create_side_panel_driving("right", is_right=True)
-    right.parent = root
-    
-    # Back panel
-    print("  Creating back panel...")
-    back = create_box("back", (0.02, 0.98, 1.60), (-0.84, 0, 0.90))
-    back.parent = root
-    
-    # Top panel
-    print("  Creating top panel...")
-    top = create_box("top", (0.70, 0.98, 0.02), (-0.47, 0, 1.94))
-    top.parent = root
-    
-    # Bottom/floor panel
-    print("  Creating bottom panel...")
-    bottom = create_box("bottom", (0.85, 0.98, 0.02), (-0.42, 0, 0.01))
-    bottom.parent = root
-    
-    # Dashboard panel (where gauges go)
-    print("  Creating dashboard...")
-    dashboard = create_box("dashboard", (0.25, 0.70, 0.02), (-0.27, 0, 0.72))
-    dashboard.rotation_euler = (0.8, 0, 0)  # Angled toward player
-    bpy.ops.object.transform_apply(rotation=True)
-    dashboard.parent = root
+    create_side_panel_driving("left", is_right=False)
+    
+    create_side_panel_driving("right", is_right=True)
+    
+    # Back, top, bottom, dashboard, marquee box, coin door, speaker and
+    # front kick
+    print("  Creating box panels...")
+    create_boxes(_CABINET_PANELS)
     
     # Marquee
     print("  Creating marquee...")
-    bpy.ops.mesh.primitive_plane_add(size=1, location=(-0.17, 0, 1.90))
-    marquee = bpy.context.active_object
-    marquee.name = "marquee"
-    marquee.scale = (0.90, 0.12, 1)
-    marquee.rotation_euler = (math.pi/2, -0.15, 0)
-    bpy.ops.object.transform_apply(scale=True, rotation=True)
-    marquee.parent = root
-    
-    # Marquee box
-    marquee_box = create_box("marquee-box", (0.12, 0.98, 0.15), (-0.19, 0, 1.87))
-    marquee_box.parent = root
+    create_plane("marquee", (0.90, 0.12), (-0.17, 0, 1.90), (math.pi/2, -0.15, 0))
     
     # Bezel (wide screen for racing)
     print("  Creating bezel...")
     bezel = create_bezel_with_cutout("bezel", 0.90, 0.55, 0.75, 0.45, 0.02)
     bezel.location = (-0.32, 0, 1.30)
     bezel.rotation_euler = (0, -0.25, 0)  # Tilted back
-    bpy.ops.object.transform_apply(rotation=True)
-    bezel.parent = root
     
     # Screen
     print("  Creating screen...")
-    bpy.ops.mesh.primitive_plane_add(size=1, location=(-0.31, 0, 1.30))
-    screen = bpy.context.active_object
-    screen.name = "screen"
-    screen.scale = (0.72, 0.42, 1)
-    screen.rotation_euler = (math.pi/2, -0.25, 0)
-    bpy.ops.object.transform_apply(scale=True, rotation=True)
-    screen.parent = root
-    
-    # Screen mocks
-    bpy.ops.mesh.primitive_cube_add(size=0.01, location=(-0.31, 0, 1.30))
-    screen_mock_h = bpy.context.active_object
-    screen_mock_h.name = "screen-mock-horizontal"
-    screen_mock_h.scale = (0.01, 0.72, 0.42)
-    bpy.ops.object.transform_apply(scale=True)
-    screen_mock_h.parent = root
-    
-    bpy.ops.mesh.primitive_cube_add(size=0.01, location=(-0.31, 0, 1.30))
-    screen_mock_v = bpy.context.active_object
-    screen_mock_v.name = "screen-mock-vertical"
-    screen_mock_v.scale = (0.01, 0.42, 0.72)
-    bpy.ops.object.transform_apply(scale=True)
-    screen_mock_v.parent = root
+    create_plane("screen", (0.72, 0.42), (-0.31, 0, 1.30), (math.pi/2, -0.25, 0))
+    
+    # Screen mocks for orientation detection
+    create_boxes([(name, dimensions, (-0.31, 0, 1.30), (0, 0, 0))
+                  for name, dimensions in _SCREEN_MOCKS])
     
     # Steering wheel
     print("  Creating steering wheel...")
-    wheel = create_steering_wheel("steering-wheel", (-0.15, 0, 0.85))
-    wheel.parent = root
+    create_steering_wheel("steering-wheel", (-0.15, 0, 0.85))
     
     # Steering column housing
-    column = create_box("steering-column", (0.08, 0.10, 0.25), (-0.20, 0, 0.70))
-    column.rotation_euler = (0.5, 0, 0)
-    bpy.ops.object.transform_apply(rotation=True)
-    column.parent = root
+    create_box("steering-column", (0.08, 0.10, 0.25), (-0.20, 0, 0.70), (0.5, 0, 0))
     
     # Pedals
     print("  Creating pedals...")
-    create_pedals(root)
+    create_pedals()
     
     # Gear shifter
     print("  Creating gear shifter...")
-    shifter = create_gear_shifter("gear-shifter", (-0.25, 0.25, 0.55))
-    shifter.parent = root
+    create_gear_shifter("gear-shifter", (-0.25, 0.25, 0.55))
     
     # Seat
     print("  Creating seat...")
-    seat = create_seat("seat", (-0.55, 0, 0.30))
-    seat.parent = root
-    
-    # Coin door
-    print("  Creating coin door...")
-    coin_door = create_box("coin-door", (0.02, 0.15, 0.10), (-0.05, 0.30, 0.35))
-    coin_door.parent = root
-    
-    # Speaker panel (in dashboard area)
-    print("  Creating speaker panel...")
-    speaker = create_box("speaker", (0.02, 0.30, 0.08), (-0.22, 0, 1.65))
-    speaker.parent = root
-    
-    # Front kick panel (foot rest area)
-    print("  Creating front kick panel...")
-    front_kick = create_box("front-kick", (0.15, 0.60, 0.02), (-0.07, 0, 0.25))
-    front_kick.rotation_euler = (1.2, 0, 0)
-    bpy.ops.object.transform_apply(rotation=True)
-    front_kick.parent = root
+    create_seat("seat", (-0.55, 0, 0.30))
     
     # T-Molding
     print("  Creating T-molding...")
-    t_molding = create_t_molding_driving()
-    if t_molding:
-        t_molding.parent = root
+    create_t_molding_driving()
+    
+    link_pending_objects(root)
     
     print("Driving cabinet creation complete!")
     return root
 
-def export_glb(filepath):
-    """Export scene to GLB format"""
-    print(f"Exporting to: {filepath}")
-    bpy.ops.export_scene.gltf(
-        filepath=filepath,
-        export_format='GLB',
-        use_selection=False,
-        export_apply=True,
-    )
-    print("Export complete!")
-
 def main():
     argv = sys.argv
     if "--" in argv:
@@ -516,8 +333,16 @@ def main():
     else:
         output_path = argv[0]
     
-    create_driving_cabinet()
-    export_glb(output_path)
+    # No undo steps needed while building; restore the user's preference
+    # afterwards in case this runs in an interactive session
+    edit_prefs = bpy.context.preferences.edit
+    use_global_undo = edit_prefs.use_global_undo
+    edit_prefs.use_global_undo = False
+    try:
+        create_driving_cabinet()
+        export_glb(output_path)
+    finally:
+        edit_prefs.use_global_undo = use_global_undo
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Geometry math shared by the cabinet template scripts.
+
+Nothing in here touches bpy: the functions take and return NumPy arrays,
+which the template scripts push into meshes in one foreach_set call.
+"""
+
+import numpy as np
+
+# Corners of a strip's cross-section as signs of its two half-extent vectors
+_STRIP_CORNER_SIGNS = np.array([(-1, -1), (1, -1), (1, 1), (-1, 1)], dtype=np.float32)
+
+def strip_corners(starts, ends, perps):
+    """Return the 8 box corners of each axis-aligned strip as (S, 8, 3)
+
+    perps holds one pair of half-extent vectors per axis, shape (3, 2, 3);
+    each strip uses the pair for the axis its direction is dominant in.
+    Corners 0-3 ring the start point and 4-7 the end point.
+    """
+    axis = np.argmax(np.abs(ends - starts), axis=1)
+    pairs = perps[axis]
+    offsets = _STRIP_CORNER_SIGNS @ pairs
+    corners = np.concatenate([starts[:, np.newaxis] + offsets,
+                              ends[:, np.newaxis] + offsets], axis=1)
+    return corners.astype(np.float32)
+
+def shortest_arc_axes(directions):
+    """Return the images of X and Y under the rotations taking Z onto directions
+
+    The directions must be unit length, shape (S, 3). Each rotation is the
+    shortest arc I + [v]x + [v]x^2 / (1 + c), with v = Z x d and c = Z . d,
+    which needs no trig; antiparallel directions get a half turn around X.
+    """
+    dx, dy, dz = directions.T
+    antiparallel = 1 + dz < 1e-6
+    f = 1 / np.where(antiparallel, 1, 1 + dz)
+    x_axes = np.stack([1 - dx * dx * f, -dx * dy * f, -dx], axis=1)
+    y_axes = np.stack([-dx * dy * f, 1 - dy * dy * f, -dy], axis=1)
+    x_axes[antiparallel] = (1, 0, 0)
+    y_axes[antiparallel] = (0, -1, 0)
+    return x_axes, y_axes
+
+def tube_matrices(starts, ends):
+    """Return a 4x4 matrix per tube as (S, 4, 4)
+
+    Each matrix turns Z onto the tube's direction and moves the origin to
+    its midpoint, placing a Z-aligned cylinder centred on the origin.
+    """
+    d = ends - starts
+    directions = d / np.linalg.norm(d, axis=1)[:, np.newaxis]
+    x_axes, y_axes = shortest_arc_axes(directions)
+    matrices = np.zeros((len(d), 4, 4))
+    matrices[:, :3, 0] = x_axes
+    matrices[:, :3, 1] = y_axes
+    matrices[:, :3, 2] = directions
+    matrices[:, :3, 3] = (starts + ends) / 2
+    matrices[:, 3, 3] = 1
+    return matrices
+
+def tube_rings(starts, ends, radius, segments):
+    """Return the bottom and top vertex rings of each tube as (S, 2*K, 3)
+
+    Each tube is a cylinder of K = segments sides from start to end, with
+    its local Z axis turned onto the segment by shortest_arc_axes.
+    """
+    d = ends - starts
+    x_axes, y_axes = shortest_arc_axes(d / np.linalg.norm(d, axis=1)[:, np.newaxis])
+    theta = np.arange(segments) * (2 * np.pi / segments)
+    sin_r = (radius * np.sin(theta))[:, np.newaxis]
+    cos_r = (radius * np.cos(theta))[:, np.newaxis]
+    mid = ((starts + ends) / 2)[:, np.newaxis]
+    ring = mid + sin_r * x_axes[:, np.newaxis] + cos_r * y_axes[:, np.newaxis]
+    half = (d / 2)[:, np.newaxis]
+    return np.concatenate([ring - half, ring + half], axis=1).astype(np.float32)
+
+def prism_loops(n):
+    """Return the loops and loop totals of a prism over an n-gon profile
+
+    Vertices 0..n-1 are the front copy of the profile and n..2n-1 the back
+    copy. The faces are the front n-gon, the back n-gon reversed, then one
+    quad per profile edge.
+    """
+    i = np.arange(n, dtype=np.int32)
+    j = (i + 1) % n
+    sides = np.stack([i, j, j + n, i + n], axis=1)
+    loops = np.concatenate([i, n + i[::-1], sides.ravel()])
+    loop_totals = np.concatenate([[n, n], np.full(n, 4)]).astype(np.int32)
+    return loops, loop_totals
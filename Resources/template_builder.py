@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Scene, mesh and export helpers shared by the cabinet template scripts.
+
+Parts are created unlinked with add_object() and enter the scene in one
+batch through link_pending_objects() once the whole template is built.
+"""
+
+import bpy
+import numpy as np
+
+# Unit cube and plane matching bpy.ops.mesh.primitive_cube_add(size=1) and
+# primitive_plane_add(size=1), including their default UV layout
+_CUBE_VERTS = np.array([
+    (-0.5, -0.5, -0.5), (-0.5, -0.5, 0.5), (-0.5, 0.5, -0.5), (-0.5, 0.5, 0.5),
+    (0.5, -0.5, -0.5), (0.5, -0.5, 0.5), (0.5, 0.5, -0.5), (0.5, 0.5, 0.5),
+], dtype=np.float32)
+_CUBE_FACES = np.array([
+    (0, 1, 3, 2), (2, 3, 7, 6), (6, 7, 5, 4),
+    (4, 5, 1, 0), (2, 6, 4, 0), (7, 3, 1, 5),
+], dtype=np.int32)
+_CUBE_UVS = np.array([
+    (0.375, 0.0), (0.625, 0.0), (0.625, 0.25), (0.375, 0.25),
+    (0.375, 0.25), (0.625, 0.25), (0.625, 0.5), (0.375, 0.5),
+    (0.375, 0.5), (0.625, 0.5), (0.625, 0.75), (0.375, 0.75),
+    (0.375, 0.75), (0.625, 0.75), (0.625, 1.0), (0.375, 1.0),
+    (0.125, 0.5), (0.375, 0.5), (0.375, 0.75), (0.125, 0.75),
+    (0.625, 0.5), (0.875, 0.5), (0.875, 0.75), (0.625, 0.75),
+], dtype=np.float32)
+
+_PLANE_VERTS = np.array([
+    (-0.5, -0.5, 0.0), (0.5, -0.5, 0.0), (-0.5, 0.5, 0.0), (0.5, 0.5, 0.0),
+], dtype=np.float32)
+_PLANE_FACES = np.array([(0, 1, 3, 2)], dtype=np.int32)
+_PLANE_UVS = np.array([(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)], dtype=np.float32)
+
+# Objects created since the last link_pending_objects() call
+_PENDING_OBJECTS = []
+
+def clear_scene():
+    """Remove all objects from scene"""
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
+    
+    # Clear orphan data
+    for block in list(bpy.data.meshes):
+        if block.users == 0:
+            bpy.data.meshes.remove(block)
+    _PENDING_OBJECTS.clear()
+
+def mesh_from_loops(name, verts, loops, loop_totals, uvs=None):
+    """Create a flat-shaded mesh from vertices, flat face loops and face sizes"""
+    verts = np.ascontiguousarray(verts, dtype=np.float32)
+    loops = np.ascontiguousarray(loops, dtype=np.int32)
+    loop_totals = np.ascontiguousarray(loop_totals, dtype=np.int32)
+    n_faces = len(loop_totals)
+    loop_starts = np.zeros(n_faces, dtype=np.int32)
+    np.cumsum(loop_totals[:-1], out=loop_starts[1:])
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(verts))
+    mesh.loops.add(len(loops))
+    mesh.polygons.add(n_faces)
+    mesh.vertices.foreach_set("co", verts.ravel())
+    mesh.loops.foreach_set("vertex_index", loops)
+    mesh.polygons.foreach_set("loop_start", loop_starts)
+    mesh.polygons.foreach_set("loop_total", loop_totals)
+    mesh.polygons.foreach_set("use_smooth", np.zeros(n_faces, dtype=bool))
+    if uvs is not None:
+        uvs = np.ascontiguousarray(uvs, dtype=np.float32)
+        mesh.uv_layers.new(name="UVMap").data.foreach_set("uv", uvs.ravel())
+    mesh.update(calc_edges=True)
+    return mesh
+
+def mesh_from_arrays(name, verts, faces, uvs=None):
+    """Create a flat-shaded mesh from vertex and face index arrays"""
+    n_faces, face_size = faces.shape
+    loop_totals = np.full(n_faces, face_size, dtype=np.int32)
+    return mesh_from_loops(name, verts, faces.ravel(), loop_totals, uvs)
+
+def make_scaled_mesh(name, verts, faces, uvs, size):
+    """Create a mesh from unit geometry scaled by size, flipping it if mirrored"""
+    size = np.asarray(size, dtype=np.float32)
+    if np.prod(size) < 0:
+        faces = faces[:, ::-1]
+        uvs = uvs.reshape(faces.shape + (2,))[:, ::-1].reshape(-1, 2)
+    return mesh_from_arrays(name, verts * size, faces, uvs)
+
+def make_box_mesh(name, sx, sy, sz):
+    """Create a box mesh centered on the origin with the given size"""
+    return make_scaled_mesh(name, _CUBE_VERTS, _CUBE_FACES, _CUBE_UVS, (sx, sy, sz))
+
+def make_plane_mesh(name, sx, sy):
+    """Create a plane mesh in the XY plane centered on the origin"""
+    return make_scaled_mesh(name, _PLANE_VERTS, _PLANE_FACES, _PLANE_UVS, (sx, sy, 1.0))
+
+def add_object(name, mesh, location=(0, 0, 0), rotation=(0, 0, 0)):
+    """Create an object for mesh and queue it for linking to the scene"""
+    obj = bpy.data.objects.new(name, mesh)
+    obj.location = location
+    obj.rotation_euler = rotation
+    _PENDING_OBJECTS.append(obj)
+    return obj
+
+def add_bmesh_object(name, bm, location=(0, 0, 0)):
+    """Write bm to a new mesh, free it and create an object for the mesh"""
+    mesh = bpy.data.meshes.new(name)
+    bm.to_mesh(mesh)
+    bm.free()
+    return add_object(name, mesh, location)
+
+def link_pending_objects(root):
+    """Parent all queued objects to root and link them in one pass"""
+    link = bpy.context.collection.objects.link
+    for obj in _PENDING_OBJECTS:
+        if obj is not root:
+            obj.parent = root
+        link(obj)
+    _PENDING_OBJECTS.clear()
+
+def export_glb(filepath):
+    """Export scene to GLB format"""
+    print(f"Exporting to: {filepath}")
+    bpy.ops.export_scene.gltf(
+        filepath=filepath,
+        export_format='GLB',
+        use_selection=False,
+        export_apply=False,  # No modifiers; object transforms export as node TRS
+        # Static, unrigged meshes only: skip the exporter passes we never use
+        use_mesh_edges=False,
+        use_mesh_vertices=False,
+        export_normals=True,
+        export_tangents=False,
+        export_skins=False,
+        export_morph=False,
+        export_lights=False,
+        export_cameras=False,
+        export_draco_mesh_compression_enable=False,
+    )
+    print("Export complete!")